@@ -2,56 +2,99 @@
 """Generate curated offline JSON bundles for WS sets when network access is unavailable."""
 from __future__ import annotations
 
+import csv
+import io
 import json
-from dataclasses import asdict
+import os
+import sys
+from dataclasses import fields
 from pathlib import Path
 
 from import_cards import CardRow, ExportBundle, SeriesRow
 
+try:  # Optional accelerator; the stdlib fallback keeps the tools dependency-free.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
+
 ROOT = Path(__file__).parent
 OFFLINE_DIR = ROOT / "offline"
 
 
+# Parse results memoized by (table text, series id) for long-lived callers
+# that refresh repeatedly; SeriesRow itself is not hashable, so the id stands
+# in for it. The tables are small curated blobs, so the cache stays tiny.
+_PARSE_CACHE: dict[tuple[str, str], ExportBundle] = {}
+
+
 def parse_table(table: str, series: SeriesRow) -> ExportBundle:
+    cache_key = (table, series.id)
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     cards: list[CardRow] = []
-    for line in table.strip().splitlines():
-        if not line.strip() or line.strip().startswith("#"):
+    family, _, product = series.setCode.partition("/")
+    image_url_prefix = (
+        f"https://ws-tcg.com/wp/wp-content/cardlist/cardimages/{family}/{product}/"
+    )
+    # csv.reader tokenizes the whole blob in one C-level pass; QUOTE_NONE
+    # keeps the quotation marks inside card text literal.
+    reader = csv.reader(io.StringIO(table), delimiter="|", quoting=csv.QUOTE_NONE, quotechar=None)
+    for parts in reader:
+        if not parts or parts[0].lstrip()[:1] in ("", "#"):
             continue
-        parts = [part.strip() for part in line.split("|")]
         if len(parts) != 7:
-            raise ValueError(f"Expected 7 columns per line, got {len(parts)}: {line}")
-        card_code, title, rarity, color, level_text, cost_text, description = parts
+            raise ValueError(f"Expected 7 columns per line, got {len(parts)}: {'|'.join(parts)}")
+        card_code, title, rarity, color, level_text, cost_text, description = map(str.strip, parts)
         level = None if level_text == "" else int(level_text)
         cost = None if cost_text == "" else int(cost_text)
         card_id = card_code.lower().replace("/", "-")
-        family, _, product = series.setCode.partition("/")
-        image_code = card_code.replace("/", "-")
-        image_url = f"https://ws-tcg.com/wp/wp-content/cardlist/cardimages/{family}/{product}/{image_code}.png"
+        image_url = image_url_prefix + card_code.replace("/", "-") + ".png"
+        # Positional construction; arguments follow CardRow field order.
+        # Rarity and color repeat a handful of values across the table, so
+        # interning collapses them to shared objects, as the downloader does.
         cards.append(
             CardRow(
-                id=card_id,
-                seriesId=series.id,
-                cardCode=card_code,
-                title=title,
-                rarity=rarity,
-                description=description,
-                color=color or None,
-                level=level,
-                cost=cost,
-                imageUrl=image_url,
+                card_id,
+                series.id,
+                card_code,
+                title,
+                sys.intern(rarity),
+                description,
+                sys.intern(color) if color else None,
+                level,
+                cost,
+                image_url,
             )
         )
-    return ExportBundle(series=[series], cards=cards)
+    bundle = ExportBundle(series=[series], cards=cards)
+    _PARSE_CACHE[cache_key] = bundle
+    return bundle
+
+
+def _row_dict(row: object) -> dict[str, object]:
+    # Shallow per-field copy; dataclasses.asdict would deep-copy every value.
+    return {field.name: getattr(row, field.name) for field in fields(row)}  # type: ignore[arg-type]
 
 
 def write_bundle(bundle: ExportBundle, filename: str) -> None:
     path = OFFLINE_DIR / filename
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = {
-        "series": asdict(bundle.series[0]),
-        "cards": [asdict(card) for card in bundle.cards],
-    }
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # orjson serializes dataclasses natively, so no intermediate dicts at all.
+        data = {"series": bundle.series[0], "cards": bundle.cards}
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        data = {
+            "series": _row_dict(bundle.series[0]),
+            "cards": [_row_dict(card) for card in bundle.cards],
+        }
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    # One write to a sibling temp file, then an atomic swap: an interrupted
+    # run can never leave a torn bundle behind.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
     print(f"Wrote {len(bundle.cards)} cards for {bundle.series[0].name} -> {path}")
 
 
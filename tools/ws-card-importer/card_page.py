@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import html
+import json
+import random
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, build_opener
-from urllib.request import ProxyHandler
+
+from http_session import HttpResponse, HttpSession
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -17,6 +25,16 @@ DEFAULT_USER_AGENT = (
 
 CARD_PAGE_URL_TEMPLATE = "https://ws-tcg.com/cardlist/?cardno={card_code}{lang_suffix}"
 
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ws-card-importer" / "card-pages"
+DEFAULT_CACHE_TTL_SECONDS = 7 * 86400
+
+# Politeness floor between requests, plus up to _JITTER_SECONDS of random
+# spread so bursts of fetches do not hit the server in lockstep.
+_MIN_REQUEST_INTERVAL = 0.1
+_JITTER_SECONDS = 0.4
+_MAX_ATTEMPTS = 4
+_RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
 
 class CardPageFetchError(RuntimeError):
     """Raised when a card detail page cannot be downloaded or parsed."""
@@ -34,45 +52,168 @@ class CardPageDetails:
 class CardPageFetcher:
     """Downloader that fetches card detail pages and extracts metadata."""
 
-    def __init__(self, *, user_agent: str = DEFAULT_USER_AGENT) -> None:
+    def __init__(
+        self,
+        *,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_concurrency: int = 8,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+        ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+        session: HttpSession | None = None,
+    ) -> None:
         self.user_agent = user_agent
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
         self._cache: dict[tuple[str, str], CardPageDetails] = {}
-        # Explicitly disable proxies so corporate MITM proxies do not break scraping.
-        self._opener = build_opener(ProxyHandler({}))
+        self._cache_lock = threading.Lock()
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Keep-alive session: card pages all live on the same host, so
+        # reusing the connection amortizes the TLS handshake across fetches.
+        # Callers may pass a session shared with other clients for the host.
+        self._session = session if session is not None else HttpSession()
 
     def fetch(self, card_code: str, *, language: str = "ja") -> CardPageDetails:
         key = (card_code, language)
-        if key in self._cache:
-            return self._cache[key]
+        with self._cache_lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        cached = self._load_disk_cache(key)
+        if cached is not None:
+            with self._cache_lock:
+                self._cache[key] = cached
+            return cached
 
         url = build_card_page_url(card_code, language)
-        request = Request(
-            url,
-            headers={
-                "User-Agent": self.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Referer": "https://ws-tcg.com/cardlist/search/",
-            },
-        )
-        try:
-            with self._opener.open(request, timeout=30) as response:  # nosec: B310 - trusted host
-                html_text = response.read().decode("utf-8", errors="replace")
-        except HTTPError as error:  # pragma: no cover - depends on remote server
-            raise CardPageFetchError(f"HTTP {error.code} when fetching {url}") from error
-        except URLError as error:  # pragma: no cover - network branch
-            raise CardPageFetchError(f"Failed to fetch {url}: {error.reason}") from error
-
-        title = extract_title(html_text)
-        effect = extract_effect(html_text)
-        image_url = extract_image_url(html_text)
-        details = CardPageDetails(title=title, effect=effect, image_url=image_url)
-        if not any((title, effect, image_url)):
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Referer": "https://ws-tcg.com/cardlist/search/",
+        }
+        response = self._request_with_retry(url, headers)
+        html_text = response.data.decode("utf-8", errors="replace")
+
+        details = extract_details(html_text)
+        if not any((details.title, details.effect, details.image_url)):
             raise CardPageFetchError("Card detail page did not contain parsable data")
-        self._cache[key] = details
+        with self._cache_lock:
+            self._cache[key] = details
+        self._store_disk_cache(key, details)
         return details
 
+    def _request_with_retry(self, url: str, headers: dict[str, str]) -> HttpResponse:
+        """Fetch ``url`` with a politeness delay and backoff on 429/5xx."""
+        last_error: Exception | None = None
+        for attempt in range(_MAX_ATTEMPTS):
+            self._throttle()
+            try:
+                return self._session.request(url, headers=headers)
+            except HTTPError as error:
+                last_error = error
+                if error.code not in _RETRYABLE_STATUSES:
+                    raise CardPageFetchError(
+                        f"HTTP {error.code} when fetching {url}"
+                    ) from error
+            except URLError as error:
+                last_error = error
+            if attempt + 1 < _MAX_ATTEMPTS:
+                time.sleep(0.5 * (2**attempt) + random.uniform(0, _JITTER_SECONDS))
+        if isinstance(last_error, HTTPError):
+            raise CardPageFetchError(
+                f"HTTP {last_error.code} when fetching {url}"
+            ) from last_error
+        reason = getattr(last_error, "reason", last_error)
+        raise CardPageFetchError(f"Failed to fetch {url}: {reason}") from last_error
+
+    def _throttle(self) -> None:
+        # Serialize the politeness budget across worker threads.
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = (
+                max(now, self._next_request_at)
+                + _MIN_REQUEST_INTERVAL
+                + random.uniform(0, _JITTER_SECONDS)
+            )
+        if wait > 0:
+            time.sleep(wait)
+
+    def _cache_path(self, key: tuple[str, str]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        card_code, language = key
+        safe_code = card_code.replace("/", "_")
+        return self.cache_dir / language / f"{safe_code}.json"
 
+    def _load_disk_cache(self, key: tuple[str, str]) -> CardPageDetails | None:
+        path = self._cache_path(key)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        fetched_at = payload.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        return CardPageDetails(
+            title=payload.get("title"),
+            effect=payload.get("effect"),
+            image_url=payload.get("image_url"),
+        )
+
+    def _store_disk_cache(self, key: tuple[str, str], details: CardPageDetails) -> None:
+        path = self._cache_path(key)
+        if path is None:
+            return
+        payload = {
+            "fetched_at": time.time(),
+            "title": details.title,
+            "effect": details.effect,
+            "image_url": details.image_url,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        except OSError:  # pragma: no cover - cache writes are best effort
+            pass
+
+    def fetch_many(
+        self,
+        card_codes: Iterable[str],
+        *,
+        language: str = "ja",
+    ) -> list[CardPageDetails]:
+        """Fetch several card pages concurrently, preserving input order.
+
+        Detail pages are independent requests, so a bounded worker pool hides
+        most of the per-page round-trip latency while keeping the number of
+        simultaneous connections to the host polite.
+        """
+        codes = list(card_codes)
+        if not codes:
+            return []
+        workers = min(self.max_concurrency, len(codes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.fetch, code, language=language) for code in codes
+            ]
+            return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=4096)
 def build_card_page_url(card_code: str, language: str) -> str:
+    if language == "ja":
+        # Fast path for the default language; skips the normalisation below.
+        return CARD_PAGE_URL_TEMPLATE.format(
+            card_code=quote(card_code, safe="/-"), lang_suffix="&l"
+        )
     encoded_code = quote(card_code, safe="/-")
     lang = (language or "").strip().lower()
     if not lang or lang in {"ja", "jp", "japanese"}:
@@ -82,49 +223,91 @@ def build_card_page_url(card_code: str, language: str) -> str:
     return CARD_PAGE_URL_TEMPLATE.format(card_code=encoded_code, lang_suffix=lang_suffix)
 
 
-def extract_title(html_text: str) -> str | None:
-    patterns = [
+# Patterns are compiled once at import time; the extract helpers run per card
+# page, so rebuilding the pattern lists there would cost a lookup per call.
+_TITLE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
         r"<th[^>]*>\s*カード名\s*</th>\s*<td[^>]*>(.*?)</td>",
         r"<div[^>]+class=\"[^\"]*(?:cardDetail__name|cardname|card_name)[^\"]*\"[^>]*>(.*?)</div>",
         r"<p[^>]+class=\"[^\"]*(?:cardDetail__name|cardname|card_name)[^\"]*\"[^>]*>(.*?)</p>",
         r"<meta[^>]+property=\"og:title\"[^>]+content=\"([^\"]+)\"",
-    ]
-    return _first_clean_match(patterns, html_text)
-
+    )
+)
 
-def extract_effect(html_text: str) -> str | None:
-    patterns = [
+_EFFECT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
         r"<th[^>]*>\s*カードテキスト\s*</th>\s*<td[^>]*>(.*?)</td>",
         r"<th[^>]*>\s*テキスト\s*</th>\s*<td[^>]*>(.*?)</td>",
         r"<div[^>]+class=\"[^\"]*(?:cardDetail__text|cardtext|card_txt|textArea)[^\"]*\"[^>]*>(.*?)</div>",
         r"<section[^>]+class=\"[^\"]*cardText[^\"]*\"[^>]*>(.*?)</section>",
         r"<p[^>]+class=\"[^\"]*(?:cardDetail__text|cardtext|card_txt|textArea)[^\"]*\"[^>]*>(.*?)</p>",
-    ]
-    text = _first_clean_match(patterns, html_text)
+    )
+)
+
+_OG_IMAGE_RE = re.compile(
+    r"<meta[^>]+property=\"og:image\"[^>]+content=\"([^\"]+)\"", re.IGNORECASE
+)
+
+_IMAGE_TAG_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"<img[^>]+src=\"([^\"]+)\"[^>]+class=\"[^\"]*(?:cardImage|card-image|card_img)[^\"]*\"",
+        r"<img[^>]+class=\"[^\"]*(?:cardImage|card-image|card_img)[^\"]*\"[^>]+src=\"([^\"]+)\"",
+    )
+)
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# One alternation handles <br> variants (group 1, replaced by a newline),
+# whole <script>/<style> blocks, and any remaining tag in a single pass.
+_CLEAN_RE = re.compile(
+    r"(<br\s*/?>)|<(?:script|style)\b[^>]*>.*?</(?:script|style)\s*>|<[^>]+>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def extract_details(html_text: str) -> CardPageDetails:
+    """Extract title, effect text, and image URL from one card page."""
+    return CardPageDetails(
+        title=extract_title(html_text),
+        effect=extract_effect(html_text),
+        image_url=extract_image_url(html_text),
+    )
+
+
+def extract_title(html_text: str) -> str | None:
+    return _first_clean_match(_TITLE_PATTERNS, html_text)
+
+
+def extract_effect(html_text: str) -> str | None:
+    text = _first_clean_match(_EFFECT_PATTERNS, html_text)
     if not text:
         return None
     # Normalise consecutive ability separators and whitespace.
     text = text.replace("\r", "")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
 def extract_image_url(html_text: str) -> str | None:
-    patterns = [
-        r"<meta[^>]+property=\"og:image\"[^>]+content=\"([^\"]+)\"",
-        r"<img[^>]+src=\"([^\"]+)\"[^>]+class=\"[^\"]*(?:cardImage|card-image|card_img)[^\"]*\"",
-        r"<img[^>]+class=\"[^\"]*(?:cardImage|card-image|card_img)[^\"]*\"[^>]+src=\"([^\"]+)\"",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html_text, re.IGNORECASE | re.DOTALL)
+    # og:image always sits in <head>, so restrict that scan to the head
+    # region instead of sweeping the whole document with DOTALL patterns.
+    head_end = html_text.find("</head>")
+    head = html_text[:head_end] if head_end > 0 else html_text[:4096]
+    match = _OG_IMAGE_RE.search(head)
+    if match:
+        return _normalise_url(match.group(1))
+    for pattern in _IMAGE_TAG_PATTERNS:
+        match = pattern.search(html_text)
         if match:
             return _normalise_url(match.group(1))
     return None
 
 
-def _first_clean_match(patterns: list[str], html_text: str) -> str | None:
+def _first_clean_match(patterns: tuple[re.Pattern[str], ...], html_text: str) -> str | None:
     for pattern in patterns:
-        match = re.search(pattern, html_text, re.IGNORECASE | re.DOTALL)
+        match = pattern.search(html_text)
         if match:
             raw = match.group(1)
             cleaned = _clean_html(raw)
@@ -134,13 +317,8 @@ def _first_clean_match(patterns: list[str], html_text: str) -> str | None:
 
 
 def _clean_html(snippet: str) -> str:
-    snippet = snippet.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    snippet = re.sub(r"<(script|style)[^>]*>.*?</\\1>", "", snippet, flags=re.IGNORECASE | re.DOTALL)
-    snippet = re.sub(r"<[^>]+>", "", snippet)
-    text = html.unescape(snippet)
-    lines = [line.strip() for line in text.splitlines()]
-    lines = [line for line in lines if line]
-    return "\n".join(lines)
+    text = html.unescape(_CLEAN_RE.sub(lambda match: "\n" if match.group(1) else "", snippet))
+    return "\n".join(filter(None, (line.strip() for line in text.splitlines())))
 
 
 def _normalise_url(url: str) -> str:
@@ -157,4 +335,5 @@ __all__ = [
     "CardPageFetchError",
     "CardPageFetcher",
     "build_card_page_url",
+    "extract_details",
 ]
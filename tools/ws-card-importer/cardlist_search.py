@@ -2,26 +2,144 @@
 """Utilities for scraping the official Weiss Schwarz card search endpoint."""
 from __future__ import annotations
 
+import gzip
 import json
+import math
 import re
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from html.parser import HTMLParser
+from pathlib import Path
 from typing import Iterable
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, urljoin
-from urllib.request import Request, urlopen
+
+from http_session import HttpSession
+
+try:  # Optional accelerator; the stdlib fallback keeps the tools dependency-free.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
 )
 
+# The discovered search config changes rarely (only when the site ships a new
+# frontend build), so it is persisted across runs to skip the discovery fetch.
+DEFAULT_CONFIG_CACHE_PATH = Path.home() / ".cache" / "ws-card-importer" / "config.json"
+DEFAULT_CONFIG_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Crawled results are cached per (set, language) so repeated imports of the
+# same set (common while iterating on the converter) skip the crawl entirely.
+DEFAULT_RESULT_CACHE_DIR = Path.home() / ".cache" / "ws-card-importer" / "sets"
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
 
 class CardSearchError(RuntimeError):
     """Raised when the card search crawler cannot fetch or parse data."""
 
 
-@dataclass
+# Discovery patterns, compiled once; _parse_script runs them against every
+# inline <script> block on the search page.
+_AJAX_URL_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"https?://[^\"']*admin-ajax\.php",
+        r"['\"](/wp/[^'\"]*admin-ajax\.php)['\"]",
+    )
+)
+_ACTION_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"action[\"']?\s*[:=]\s*[\"']([a-zA-Z0-9_:-]+)[\"']",
+        r"['\"]action['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_NONCE_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"nonce[\"']?\s*[:=]\s*[\"']([a-zA-Z0-9]+)[\"']",
+        r"['\"]nonce['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_PACK_PARAM_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"pack(?:Param|Name)?[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
+        r"['\"]packParam['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_LANG_PARAM_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"lang(?:uage)?Param[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
+        r"['\"]lang['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_KEYWORD_PARAM_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"keywordParam[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
+        r"['\"]keyword['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_PAGE_PARAM_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"pageParam[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
+        r"['\"]page['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_PER_PAGE_PARAM_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"per(?:Page|_page|PageParam)[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
+        r"['\"]per_page['\"]\s*:\s*['\"]([^'\"]+)['\"]",
+    )
+)
+_PER_PAGE_VALUE_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"per[_ ]?page[\"']?\s*[:=]\s*([0-9]+)",
+        r"['\"]per_page['\"]\s*:\s*([0-9]+)",
+    )
+)
+
+_PARSER_FEED_CHUNK = 64 * 1024
+
+# Page size requested when the site does not advertise one. The endpoint
+# accepts well above 50, and every extra page is a full round-trip, so ask
+# big; servers that cap the size simply return fewer items per page and the
+# pagination logic adapts.
+_DEFAULT_PER_PAGE = 200
+
+# Key names observed in practice, hoisted so the hot extraction helpers skip
+# rebuilding list literals per response.
+_TOTAL_KEYS = ("total", "total_count", "totalCount", "count")
+
+# Form-field sniffing rules in priority order; the first matching token wins,
+# so "per_page" is claimed before the bare "page" rule can see it.
+_INPUT_FIELD_RULES = (
+    ("per_page", "_per_page_param"),
+    ("limit", "_per_page_param"),
+    ("keyword", "_keyword_param"),
+    ("lang", "_lang_param"),
+    ("page", "_page_param"),
+)
+_SELECT_FIELD_RULES = (
+    ("per_page", "_per_page_param"),
+    ("limit", "_per_page_param"),
+    ("lang", "_lang_param"),
+)
+_ITEM_KEYS = ("items", "cards", "list", "data", "results")
+_MAX_PAGE_KEYS = ("maxPage", "max_page", "total_pages", "page_max")
+_PAGER_MAX_KEYS = ("max", "maxPage", "pageMax", "last", "totalPages")
+
+
+@dataclass(slots=True)
 class SearchConfig:
     base_url: str
     ajax_url: str
@@ -35,9 +153,12 @@ class SearchConfig:
     per_page_param: str | None = None
     per_page: int | None = None
     additional_params: list[tuple[str, str]] = field(default_factory=list)
+    # Pack parameter variant confirmed to return results; recorded after the
+    # first successful narrow probe so later requests skip the fan-out.
+    winning_pack_param: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     info: dict[str, object]
     cards: list[object]
@@ -50,78 +171,361 @@ class CardSearchClient:
         self,
         base_url: str = "https://ws-tcg.com/cardlist/search/",
         user_agent: str = DEFAULT_USER_AGENT,
+        config_cache: Path | None = DEFAULT_CONFIG_CACHE_PATH,
+        result_cache_dir: Path | None = DEFAULT_RESULT_CACHE_DIR,
+        session: HttpSession | None = None,
     ) -> None:
         self.base_url = base_url
         self.user_agent = user_agent
-        self.config = self._discover_config()
+        self._config_cache = config_cache
+        self._result_cache_dir = result_cache_dir
+        # Keep-alive session: discovery and every pagination request hit the
+        # same host, so one connection amortizes the TLS handshake. Callers
+        # may pass a session shared with other clients for the same host.
+        self._session = session if session is not None else HttpSession()
+        self._config: SearchConfig | None = None
+
+    @property
+    def config(self) -> SearchConfig:
+        """Discovered search config, resolved lazily on first use.
+
+        Construction stays network-free; the discovery fetch (or config
+        cache read) happens on the first request that needs it.
+        """
+        if self._config is None:
+            self._config = self._load_config_cache() or self._discover_config()
+        return self._config
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def fetch_cards(self, set_code: str, language: str | None = None) -> SearchResult:
-        cards = self._fetch_cards_for_set(set_code, language or "en")
+    def fetch_cards(
+        self,
+        set_code: str,
+        language: str | None = None,
+        *,
+        refresh: bool = False,
+        max_age_seconds: float = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+    ) -> SearchResult:
+        language = language or "en"
+        if not refresh:
+            cached = self._load_result_cache(set_code, language, max_age_seconds)
+            if cached is not None:
+                return cached
+        cards = self._fetch_cards_for_set(set_code, language)
         if not cards:
             raise CardSearchError(f"No cards returned for set {set_code}")
         info = self._derive_series_info(cards, set_code)
+        result = SearchResult(info=info, cards=cards)
+        self._save_result_cache(set_code, language, result)
+        return result
+
+    def iter_cards(self, set_code: str, language: str | None = None) -> Iterable[object]:
+        """Yield cards as their pages arrive instead of waiting for all of them.
+
+        Page 1 is yielded immediately; the remaining known pages stream in
+        completion order so downstream processing overlaps the outstanding
+        fetches. Cards arrive unordered across pages, and no result caching
+        applies — callers that need ordering or memoization should use
+        ``fetch_cards``.
+        """
+        language = language or "en"
+        config = self.config
+        data = self._fetch_first_page(config, set_code, language)
+        items = _extract_items(data)
+        if not items:
+            return
+        yield from items
+
+        expected_total = _extract_int(data, _TOTAL_KEYS)
+        if expected_total is not None and len(items) >= expected_total:
+            return
+
+        total_pages = self._derive_total_pages(config, data, expected_total, len(items))
+        if total_pages is not None:
+            if total_pages > 1:
+                pages = range(2, total_pages + 1)
+                with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                    futures = [
+                        executor.submit(
+                            self._fetch_page, config, set_code, language, page
+                        )
+                        for page in pages
+                    ]
+                    for future in as_completed(futures):
+                        yield from _extract_items(future.result())
+            return
+
+        # Unknown page count: probe sequentially, yielding page by page.
+        yielded = len(items)
+        page = 2
+        while page <= 200:
+            if not self._has_next_page(config, data, page - 1, len(items)):
+                break
+            data = self._fetch_page(config, set_code, language, page)
+            items = _extract_items(data)
+            if not items:
+                break
+            yield from items
+            yielded += len(items)
+            if expected_total is not None and yielded >= expected_total:
+                break
+            page += 1
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+    def _result_cache_path(self, set_code: str, language: str) -> Path:
+        assert self._result_cache_dir is not None
+        safe_code = set_code.replace("/", "_")
+        return self._result_cache_dir / language / f"{safe_code}.json.gz"
+
+    def _load_result_cache(
+        self, set_code: str, language: str, max_age_seconds: float
+    ) -> SearchResult | None:
+        if self._result_cache_dir is None:
+            return None
+        path = self._result_cache_path(set_code, language)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                cached = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        fetched_at = cached.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        if time.time() - fetched_at > max_age_seconds:
+            return None
+        cards = cached.get("cards")
+        info = cached.get("info")
+        if not isinstance(cards, list) or not cards or not isinstance(info, dict):
+            return None
         return SearchResult(info=info, cards=cards)
 
+    def _save_result_cache(self, set_code: str, language: str, result: SearchResult) -> None:
+        if self._result_cache_dir is None:
+            return
+        path = self._result_cache_path(set_code, language)
+        payload = {
+            "fetched_at": time.time(),
+            "info": result.info,
+            "cards": result.cards,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False)
+        except (OSError, TypeError):
+            # Caching is best effort; the crawl itself already succeeded.
+            pass
+
     # ------------------------------------------------------------------
     # Discovery helpers
     # ------------------------------------------------------------------
     def _discover_config(self) -> SearchConfig:
         html = self._fetch_html(self.base_url)
         parser = _SearchPageParser()
-        parser.feed(html)
+        # html.parser walks the document in pure Python, so avoid feeding the
+        # whole (content-heavy) page: stream it in slices and stop as soon as
+        # the search form has closed and every config field is known.
+        for start in range(0, len(html), _PARSER_FEED_CHUNK):
+            parser.feed(html[start : start + _PARSER_FEED_CHUNK])
+            if parser.can_stop_feeding():
+                break
         parser.close()
         config = parser.to_config(self.base_url)
         if not config.ajax_url:
             raise CardSearchError("Could not determine card search AJAX endpoint")
+        self._save_config_cache(config)
+        return config
+
+    def _load_config_cache(self) -> SearchConfig | None:
+        """Return a cached, still-fresh config for ``base_url``, if any."""
+        if self._config_cache is None:
+            return None
+        try:
+            cached = json.loads(self._config_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        entry = cached.get(self.base_url) if isinstance(cached, dict) else None
+        if not isinstance(entry, dict):
+            return None
+        fetched_at = entry.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        if time.time() - fetched_at > DEFAULT_CONFIG_CACHE_TTL_SECONDS:
+            return None
+        data = entry.get("config")
+        if not isinstance(data, dict):
+            return None
+        try:
+            config = SearchConfig(**data)
+        except TypeError:
+            # Cache written by an older version of this module.
+            return None
+        config.additional_params = [tuple(pair) for pair in config.additional_params]
         return config
 
+    def _save_config_cache(self, config: SearchConfig) -> None:
+        if self._config_cache is None:
+            return
+        try:
+            cached = json.loads(self._config_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+        if not isinstance(cached, dict):
+            cached = {}
+        cached[self.base_url] = {"fetched_at": time.time(), "config": asdict(config)}
+        try:
+            self._config_cache.parent.mkdir(parents=True, exist_ok=True)
+            self._config_cache.write_text(
+                json.dumps(cached, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+        except OSError:
+            # Caching is best effort; discovery still succeeded.
+            pass
+
     def _fetch_html(self, url: str) -> str:
-        request = Request(url, headers={"User-Agent": self.user_agent, "Accept": "text/html"})
+        headers = {"User-Agent": self.user_agent, "Accept": "text/html"}
         try:
-            with urlopen(request, timeout=30) as response:  # nosec: B310 - trusted domain
-                return response.read().decode("utf-8", errors="replace")
+            response = self._session.request(url, headers=headers)
         except HTTPError as error:  # pragma: no cover - network branch
             raise CardSearchError(f"HTTP error {error.code} when loading {url}") from error
         except URLError as error:  # pragma: no cover - network branch
             raise CardSearchError(f"Failed to reach {url}: {error.reason}") from error
+        return response.data.decode("utf-8", errors="replace")
 
     # ------------------------------------------------------------------
     # Request orchestration
     # ------------------------------------------------------------------
     def _fetch_cards_for_set(self, set_code: str, language: str) -> list[object]:
         config = self.config
-        results: list[object] = []
-        page = 1
-        expected_total: int | None = None
-
+        data = self._fetch_first_page(config, set_code, language)
+        items = _extract_items(data)
+        if not items:
+            return []
+        results: list[object] = list(items)
+
+        expected_total = _extract_int(data, _TOTAL_KEYS)
+        if expected_total is not None and len(results) >= expected_total:
+            return results
+
+        total_pages = self._derive_total_pages(config, data, expected_total, len(items))
+        if total_pages is not None:
+            # Page count is known up front, so the remaining pages are
+            # independent requests and can be fetched concurrently. Every
+            # page's offset is also known, so results are preallocated once
+            # and filled by slice assignment instead of growing the list.
+            if total_pages > 1:
+                page_size = len(items)
+                results = [None] * max(expected_total or 0, page_size)
+                results[:page_size] = items
+                pages = range(2, total_pages + 1)
+                with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                    futures = [
+                        (
+                            page,
+                            executor.submit(
+                                self._fetch_page, config, set_code, language, page
+                            ),
+                        )
+                        for page in pages
+                    ]
+                    for page, future in futures:
+                        page_items = _extract_items(future.result())
+                        start = (page - 1) * page_size
+                        results[start : start + len(page_items)] = page_items
+                if None in results:
+                    # A page came back short (not necessarily the last one);
+                    # drop every unfilled slot so no placeholder leaks into
+                    # the result or the on-disk cache.
+                    results = [item for item in results if item is not None]
+            return results
+
+        # Unknown page count: probe sequentially as before.
+        page = 2
         while page <= 200:
-            payload = self._build_payload(config, set_code, language, page)
-            data = self._execute_request(config.ajax_url, payload)
+            if not self._has_next_page(config, data, page - 1, len(items)):
+                break
+            data = self._fetch_page(config, set_code, language, page)
             items = _extract_items(data)
             if not items:
                 break
             results.extend(items)
-
-            if expected_total is None:
-                expected_total = _extract_int(data, ["total", "total_count", "totalCount", "count"])
             if expected_total is not None and len(results) >= expected_total:
                 break
-
-            if not self._has_next_page(config, data, page, len(items)):
-                break
             page += 1
 
         return results
 
+    def _fetch_first_page(
+        self, config: SearchConfig, set_code: str, language: str
+    ) -> object:
+        """Fetch page 1, probing with a single pack pair before fanning out.
+
+        The fan-out in ``_encode_pack_values`` sends up to a dozen redundant
+        form fields per request. A narrow probe usually succeeds, and once it
+        does the winning parameter is recorded on the config so every later
+        page (and run, via the config cache) sends just one pair.
+        """
+        if config.winning_pack_param is None:
+            pairs = [(config.pack_param or "pack[]", set_code.strip())]
+            payload = self._build_payload(config, set_code, language, 1, pack_pairs=pairs)
+            data = self._execute_request(config.ajax_url, payload)
+            if _extract_items(data):
+                config.winning_pack_param = pairs[0][0]
+                self._save_config_cache(config)
+                return data
+            return self._fetch_page(config, set_code, language, 1)
+
+        data = self._fetch_page(config, set_code, language, 1)
+        if _extract_items(data):
+            return data
+        # The recorded parameter won for an earlier set but not this one.
+        # Drop it (and the cached copy) so this page-1 retry and every later
+        # page fall back to the full fan-out instead of reporting the set
+        # empty; the next successful narrow probe records a fresh winner.
+        config.winning_pack_param = None
+        self._save_config_cache(config)
+        return self._fetch_page(config, set_code, language, 1)
+
+    def _fetch_page(
+        self, config: SearchConfig, set_code: str, language: str, page: int
+    ) -> object:
+        payload = self._build_payload(config, set_code, language, page)
+        return self._execute_request(config.ajax_url, payload)
+
+    def _derive_total_pages(
+        self,
+        config: SearchConfig,
+        data: object,
+        expected_total: int | None,
+        first_page_size: int,
+    ) -> int | None:
+        """Compute the page count from the first response when possible."""
+        # An explicit max-page field beats deriving from the total and lets
+        # even total-less responses skip the sequential probing fallback.
+        max_page = _extract_int(data, _MAX_PAGE_KEYS)
+        if max_page is None and type(data) is dict:
+            max_page = _extract_int(data.get("pager"), _PAGER_MAX_KEYS)
+        if max_page is not None:
+            return max_page
+        if expected_total is None:
+            return None
+        # The caller already returned when page 1 covered the total, so a
+        # first page smaller than the requested size means the server capped
+        # the page size; the observed size is the divisor, not per_page.
+        return math.ceil(expected_total / first_page_size)
+
     def _build_payload(
         self,
         config: SearchConfig,
         set_code: str,
         language: str,
         page: int,
+        pack_pairs: list[tuple[str, str]] | None = None,
     ) -> list[tuple[str, str]]:
         payload: list[tuple[str, str]] = list(config.additional_params)
 
@@ -136,7 +540,7 @@ class CardSearchClient:
         lang_param = config.lang_param or "lang"
         payload.append((lang_param, language))
 
-        per_page = config.per_page or 50
+        per_page = config.per_page or _DEFAULT_PER_PAGE
         if config.per_page_param:
             payload.append((config.per_page_param, str(per_page)))
         else:
@@ -146,56 +550,67 @@ class CardSearchClient:
         page_param = config.page_param or "page"
         payload.append((page_param, str(page)))
 
-        payload.extend(self._encode_pack_values(config.pack_param, set_code))
+        if pack_pairs is None:
+            if config.winning_pack_param:
+                pack_pairs = [(config.winning_pack_param, set_code.strip())]
+            else:
+                pack_pairs = self._encode_pack_values(config.pack_param, set_code)
+        payload.extend(pack_pairs)
         return payload
 
     def _encode_pack_values(self, pack_param: str | None, set_code: str) -> list[tuple[str, str]]:
         if not pack_param:
             pack_param = "pack[]"
         cleaned = set_code.strip()
-        values = {cleaned}
+        values = [cleaned]
         if "/" in cleaned:
-            family, suffix = cleaned.split("/", 1)
-            values.add(family)
-            values.add(suffix)
-        result: set[tuple[str, str]] = set()
+            values.extend(cleaned.split("/", 1))
+        # dict.fromkeys-style ordered dedupe: insertion order survives, so the
+        # encoded body is byte-identical across runs (cache-friendly) and the
+        # sorted() pass is gone.
+        result: dict[tuple[str, str], None] = {}
         for value in values:
             if not value:
                 continue
-            result.add((pack_param, value))
+            result[(pack_param, value)] = None
             if pack_param.endswith("[]"):
-                result.add((pack_param[:-2], value))
+                result[(pack_param[:-2], value)] = None
             else:
-                result.add((pack_param + "[]", value))
-            result.add(("pack[]", value))
-            result.add(("set[]", value))
-            result.add(("product[]", value))
-        return sorted(result)
+                result[(pack_param + "[]", value)] = None
+            result[("pack[]", value)] = None
+            result[("set[]", value)] = None
+            result[("product[]", value)] = None
+        return list(result)
 
     def _execute_request(self, url: str, payload: list[tuple[str, str]]) -> object:
-        data = urlencode(payload, doseq=True).encode("utf-8")
-        request = Request(
-            url,
-            data=data,
-            headers={
-                "User-Agent": self.user_agent,
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Referer": self.base_url,
-            },
-        )
+        body = urlencode(payload, doseq=True).encode("utf-8")
+        headers = {
+            "User-Agent": self.user_agent,
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Referer": self.base_url,
+        }
         try:
-            with urlopen(request, timeout=30) as response:  # nosec: B310 - trusted host
-                text = response.read().decode("utf-8", errors="replace")
+            response = self._session.request(url, method="POST", headers=headers, body=body)
         except HTTPError as error:  # pragma: no cover - network branch
             raise CardSearchError(f"Search request failed with HTTP {error.code}") from error
         except URLError as error:  # pragma: no cover - network branch
             raise CardSearchError(f"Could not reach search endpoint: {error.reason}") from error
 
+        raw = response.data
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as error:
-            raise CardSearchError(f"Invalid JSON payload from card search: {error}") from error
+            # Both decoders take bytes directly, skipping a str copy per page.
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
+        except ValueError:
+            # Strict UTF-8 failed; retry leniently before giving up.
+            try:
+                return json.loads(raw.decode("utf-8", errors="replace"))
+            except json.JSONDecodeError as error:
+                raise CardSearchError(
+                    f"Invalid JSON payload from card search: {error}"
+                ) from error
 
     def _has_next_page(
         self,
@@ -218,11 +633,11 @@ class CardSearchClient:
                 flag = pager.get(key)
                 if isinstance(flag, bool):
                     return flag
-            max_page = _extract_int(pager, ["max", "maxPage", "pageMax", "last", "totalPages"])
+            max_page = _extract_int(pager, _PAGER_MAX_KEYS)
             if max_page is not None:
                 return page < max_page
 
-        max_page = _extract_int(data, ["maxPage", "max_page", "total_pages", "page_max"])
+        max_page = _extract_int(data, _MAX_PAGE_KEYS)
         if max_page is not None:
             return page < max_page
 
@@ -326,28 +741,35 @@ class _SearchPageParser(HTMLParser):
                     self._action = value
                     return
                 self._additional.append((name, value))
-            if ("pack" in name or "series" in name) and value and "/" in value and not self._pack_param:
+            name_lower = name.lower()
+            if (
+                ("pack" in name_lower or "series" in name_lower)
+                and value
+                and "/" in value
+                and not self._pack_param
+            ):
                 self._pack_param = name
-            if "lang" in name and not self._lang_param:
-                self._lang_param = name
-            if "keyword" in name and not self._keyword_param:
-                self._keyword_param = name
-            if "page" in name and not self._page_param:
-                self._page_param = name
-            if ("per_page" in name or "limit" in name) and not self._per_page_param:
-                self._per_page_param = name
-                if value.isdigit():
-                    self._per_page = int(value)
+            for token, attr in _INPUT_FIELD_RULES:
+                if token in name_lower:
+                    if getattr(self, attr) is None:
+                        setattr(self, attr, name)
+                        if attr == "_per_page_param" and value.isdigit():
+                            self._per_page = int(value)
+                    break
         elif self._in_form and tag == "select":
             name = attr.get("name")
             if not name:
                 return
-            if "lang" in name and not self._lang_param:
-                self._lang_param = name
-            if ("per_page" in name or "limit" in name) and not self._per_page_param:
-                self._per_page_param = name
+            name_lower = name.lower()
+            for token, attr_name in _SELECT_FIELD_RULES:
+                if token in name_lower:
+                    if getattr(self, attr_name) is None:
+                        setattr(self, attr_name, name)
+                    break
         elif tag == "script":
-            self._capture_script = True
+            # Once discovery is complete there is nothing left to find, so
+            # avoid accumulating (potentially large) inline script bodies.
+            self._capture_script = not self._discovery_complete()
             self._script_chunks = []
 
     def handle_endtag(self, tag: str):
@@ -357,103 +779,81 @@ class _SearchPageParser(HTMLParser):
                 self._in_form = False
         elif tag == "script" and self._capture_script:
             self._capture_script = False
-            self._parse_script("".join(self._script_chunks))
+            # Join only when a single chunk isn't already the whole body; the
+            # regexes must see the full script, so chunks cannot be scanned
+            # independently without risking matches split across boundaries.
+            chunks = self._script_chunks
+            self._script_chunks = []
+            self._parse_script(chunks[0] if len(chunks) == 1 else "".join(chunks))
 
     def handle_data(self, data: str):
         if self._capture_script:
             self._script_chunks.append(data)
 
+    def can_stop_feeding(self) -> bool:
+        """True when feeding more of the document cannot add config data."""
+        return (
+            not self._in_form
+            and not self._capture_script
+            and self._discovery_complete()
+        )
+
+    def _discovery_complete(self) -> bool:
+        return all(
+            (
+                self._ajax_url,
+                self._action,
+                self._nonce,
+                self._pack_param,
+                self._lang_param,
+                self._keyword_param,
+                self._page_param,
+                self._per_page_param,
+                self._per_page,
+            )
+        )
+
     def _parse_script(self, data: str) -> None:
+        # The config script sits near the top of the page; once every field
+        # is known the remaining inline scripts need no regex work at all.
+        if self._discovery_complete():
+            return
         if not data.strip():
             return
         if not self._ajax_url:
-            ajax_match = _regex_first(
-                [
-                    r"https?://[^\"']*admin-ajax\.php",
-                    r"['\"](/wp/[^'\"]*admin-ajax\.php)['\"]",
-                ],
-                data,
-            )
+            ajax_match = _regex_first(_AJAX_URL_RES, data)
             if ajax_match:
                 self._ajax_url = ajax_match
         if not self._action:
-            value = _regex_first(
-                [
-                    r"action[\"']?\s*[:=]\s*[\"']([a-zA-Z0-9_:-]+)[\"']",
-                    r"['\"]action['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_ACTION_RES, data)
             if value:
                 self._action = value
         if not self._nonce:
-            value = _regex_first(
-                [
-                    r"nonce[\"']?\s*[:=]\s*[\"']([a-zA-Z0-9]+)[\"']",
-                    r"['\"]nonce['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_NONCE_RES, data)
             if value:
                 self._nonce = value
         if not self._pack_param:
-            value = _regex_first(
-                [
-                    r"pack(?:Param|Name)?[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
-                    r"['\"]packParam['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_PACK_PARAM_RES, data)
             if value:
                 self._pack_param = value
         if not self._lang_param:
-            value = _regex_first(
-                [
-                    r"lang(?:uage)?Param[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
-                    r"['\"]lang['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_LANG_PARAM_RES, data)
             if value:
                 self._lang_param = value
         if not self._keyword_param:
-            value = _regex_first(
-                [
-                    r"keywordParam[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
-                    r"['\"]keyword['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_KEYWORD_PARAM_RES, data)
             if value:
                 self._keyword_param = value
         if not self._page_param:
-            value = _regex_first(
-                [
-                    r"pageParam[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
-                    r"['\"]page['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_PAGE_PARAM_RES, data)
             if value:
                 self._page_param = value
         if not self._per_page_param:
-            value = _regex_first(
-                [
-                    r"per(?:Page|_page|PageParam)[\"']?\s*[:=]\s*[\"']([^'\"]+)[\"']",
-                    r"['\"]per_page['\"]\s*:\s*['\"]([^'\"]+)['\"]",
-                ],
-                data,
-            )
+            value = _regex_first(_PER_PAGE_PARAM_RES, data)
             if value:
                 self._per_page_param = value
         if not self._per_page:
-            per_page_str = _regex_first(
-                [
-                    r"per[_ ]?page[\"']?\s*[:=]\s*([0-9]+)",
-                    r"['\"]per_page['\"]\s*:\s*([0-9]+)",
-                ],
-                data,
-            )
+            per_page_str = _regex_first(_PER_PAGE_VALUE_RES, data)
             if per_page_str and per_page_str.isdigit():
                 self._per_page = int(per_page_str)
 
@@ -477,30 +877,33 @@ class _SearchPageParser(HTMLParser):
 
 
 def _extract_items(data: object) -> list[object]:
-    if isinstance(data, list):
+    # Exact type checks: json.loads only ever produces plain list/dict/str/int,
+    # and type(x) is T beats isinstance in this per-response hot path.
+    if type(data) is list:
         return data
-    if isinstance(data, dict):
-        for key in ("items", "cards", "list", "data", "results"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return value
-            if isinstance(value, dict):
-                nested = value.get("items") or value.get("list") or value.get("rows")
-                if isinstance(nested, list):
-                    return nested
+    if type(data) is not dict:
+        return []
+    for key in _ITEM_KEYS:
+        value = data.get(key)
+        if type(value) is list:
+            return value
+        if type(value) is dict:
+            nested = value.get("items") or value.get("list") or value.get("rows")
+            if type(nested) is list:
+                return nested
     return []
 
 
 def _extract_int(source: object, keys: Iterable[str]) -> int | None:
-    if not isinstance(source, dict):
+    if type(source) is not dict:
         return None
     for key in keys:
         value = source.get(key)
-        if isinstance(value, int):
+        if type(value) is int:
             return value
-        if isinstance(value, str) and value.isdigit():
+        if type(value) is str and value.isdigit():
             return int(value)
-        if isinstance(value, dict):
+        if type(value) is dict:
             nested = _extract_int(value, keys)
             if nested is not None:
                 return nested
@@ -517,9 +920,9 @@ def _first_non_empty(source: dict[str, object], keys: Iterable[str]) -> str | No
     return None
 
 
-def _regex_first(patterns: Iterable[str], data: str) -> str | None:
+def _regex_first(patterns: Iterable[re.Pattern[str]], data: str) -> str | None:
     for pattern in patterns:
-        match = re.search(pattern, data)
+        match = pattern.search(data)
         if match:
             group = match.group(1) if match.groups() else match.group(0)
             if group:
@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as _dt
+import functools
 import json
+import multiprocessing
+import os
+import pickle
 import re
+import socket
 import sys
+import threading
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, Sequence
 from urllib.error import URLError, HTTPError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
 
 from cardlist_search import CardSearchClient, CardSearchError
-from card_page import CardPageFetchError, CardPageFetcher
+from card_page import CardPageDetails, CardPageFetchError, CardPageFetcher
+from http_session import HttpResponse, HttpSession
 from import_cards import CardRow, ExportBundle, SeriesRow, mirror_android_assets_if_applicable
 
+try:  # Optional accelerator; the stdlib fallback keeps the tools dependency-free.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
+
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
@@ -26,16 +40,20 @@ USER_AGENT = (
 # that product line.
 OFFICIAL_EXPORT_TEMPLATE = "https://ws-tcg.com/wp/wp-content/cardlist/db/export/pack/{set_code}.json"
 
+# Values are interned so every CardRow shares one object per rarity bucket.
 RARITY_NORMALISATION = {
-    "C": "C",
-    "U": "U",
-    "R": "R",
-    "SR": "SR",
-    "RR": "SR",
-    "RRR": "SP",
-    "SEC": "SP",
-    "SP": "SP",
-    "SSP": "SP",
+    key: sys.intern(value)
+    for key, value in {
+        "C": "C",
+        "U": "U",
+        "R": "R",
+        "SR": "SR",
+        "RR": "SR",
+        "RRR": "SP",
+        "SEC": "SP",
+        "SP": "SP",
+        "SSP": "SP",
+    }.items()
 }
 
 SET_NAME_OVERRIDES: dict[str, str] = {
@@ -43,11 +61,81 @@ SET_NAME_OVERRIDES: dict[str, str] = {
     "SFN": "葬送のフリーレン / Frieren: Beyond Journey's End",
 }
 
+# Compiled once at import; the slug helpers run for every card in every set,
+# and pattern.method(s) skips the re-module cache lookup that re.sub pays.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RUN_RE = re.compile(r"-+")
+# Inputs that are already canonical slugs/identifiers pass through untouched;
+# one C-level match beats rebuilding an identical string.
+_CANONICAL_SLUG_RE = re.compile(r"[0-9a-z]+(?:-[0-9a-z]+)*\Z")
+_CANONICAL_IDENTIFIER_RE = re.compile(r"[0-9a-z]+(?:_[0-9a-z]+)*\Z")
+_IDENTIFIER_RE = re.compile(r"[^0-9a-z_]+")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_YEAR_RE = re.compile(r"(20\d{2}|19\d{2})")
+
+# Lowercase + non-alphanumeric-to-dash fused into one C-level translate pass
+# for the common all-ASCII card codes; see _slug below.
+_SLUG_TABLE = {
+    code: (chr(code).lower() if chr(code).isalnum() else "-") for code in range(128)
+}
+# Underscore analogue of _SLUG_TABLE for the image-filename identifiers.
+_IDENTIFIER_TABLE = {
+    code: (chr(code).lower() if chr(code).isalnum() else "_") for code in range(128)
+}
+
+# Accepted key aliases per CardRow input slot, in priority order. Flattened
+# into one alias -> (slot, rank) map so build_card_row extracts every field
+# in a single pass over the raw dict instead of seven _first_str scans.
+_CARD_FIELD_ALIASES = (
+    ("card_no", "cardNo", "cardCode", "card_code", "number"),  # card code
+    ("card_name", "cardName", "name", "title"),  # title
+    ("rarity", "rare", "rar"),  # rarity
+    ("color", "colour", "card_color", "attribute"),  # color
+    ("level", "lv"),  # level
+    ("cost", "c"),  # cost
+    ("image", "imageUrl", "image_url", "card_image"),  # image URL
+)
+_CARD_FIELD_MAP = {
+    alias: (slot, rank)
+    for slot, aliases in enumerate(_CARD_FIELD_ALIASES)
+    for rank, alias in enumerate(aliases)
+}
+
+# Row construction is pure CPU work, so sets larger than this are split
+# across a process pool; smaller sets stay serial to avoid fork overhead.
+_PARALLEL_BUILD_THRESHOLD = 500
+
+# Description sources in output order; checked once per card.
+_DESC_KEYS = (
+    "ability",
+    "ability1",
+    "ability2",
+    "ability_text",
+    "text",
+    "effect",
+    "flavor",
+    "flavor_text",
+    "ability_en",
+)
+_DESC_KEYS_SET = frozenset(_DESC_KEYS)
+
+# Candidate keys for the set-level metadata block and its fields; hoisted so
+# the per-set lookups never rebuild the lists.
+_INFO_KEYS = ("pack", "info", "product", "meta", "header")
+_SERIES_TITLE_KEYS = ("name", "title", "packTitle", "productName", "product_title")
+_SERIES_SET_CODE_KEYS = ("setCode", "set_code", "productCode", "product_code", "series", "series_id")
+_RELEASE_DATE_KEYS = ("release", "releaseDate", "release_date", "date")
+
 
-_SEARCH_CLIENT: CardSearchClient | object | None = None
-_SEARCH_CLIENT_FAILED = object()
-_CARD_PAGE_FETCHER: CardPageFetcher | object | None = None
-_CARD_PAGE_FETCHER_FAILED = object()
+# Shared keep-alive session: the export endpoint, the search crawler, and the
+# card detail pages all resolve to a handful of hosts, so one session pools
+# every connection. Connections are per thread, matching the pool workers in
+# main().
+_SESSION = HttpSession()
+
+# Flipped once detail pages start failing; later sets then skip them instead
+# of repeating a doomed request per card.
+_CARD_PAGE_FETCHER_DISABLED = False
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -85,25 +173,81 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 
 def main(argv: Sequence[str]) -> int:
     args = parse_args(argv)
+    # Warm the resolver for the official host while the offline index and
+    # worker pool spin up, so no worker's first request waits on DNS.
+    threading.Thread(
+        target=_preresolve_host, args=(OFFICIAL_EXPORT_TEMPLATE,), daemon=True
+    ).start()
     language = (args.language or "ja").strip() or "ja"
-    bundles = []
-    for set_code in args.sets:
-        bundle = load_set_bundle(set_code, args.offline_dir, language)
-        bundles.append(bundle)
+    # Resolve offline fallbacks with one directory scan instead of a stat per
+    # set inside each worker.
+    offline_index = _index_offline_dir(args.offline_dir)
+    # Sets are independent and the work is network-bound, so fetch them
+    # concurrently; gathering futures in submission order keeps the merge
+    # deterministic.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, max(1, len(args.sets)))
+    ) as executor:
+        futures = [
+            executor.submit(
+                load_set_bundle,
+                set_code,
+                args.offline_dir,
+                language,
+                offline_path=offline_index.get(set_code.upper()),
+            )
+            for set_code in args.sets
+        ]
+        bundles = [future.result() for future in futures]
 
     merged = merge_bundles(bundles)
-    output_text = merged.to_json(pretty=args.pretty)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(output_text, encoding="utf-8")
-    mirror_android_assets_if_applicable(args.output, output_text)
+    merged.write_json_stream(args.output, pretty=args.pretty)
+    # The mirror is a plain file copy of what was just written, so overlap it
+    # with the summary output instead of serializing the two steps.
+    mirror_thread = threading.Thread(
+        target=mirror_android_assets_if_applicable, args=(args.output,)
+    )
+    mirror_thread.start()
     print(
         f"Wrote {len(merged.series)} series and {len(merged.cards)} cards to {args.output}",
         file=sys.stderr,
     )
+    mirror_thread.join()
     return 0
 
 
-def load_set_bundle(set_code: str, offline_dir: Path, language: str) -> ExportBundle:
+def _preresolve_host(url: str) -> None:
+    host = urlsplit(url).hostname
+    if not host:
+        return
+    try:
+        socket.getaddrinfo(host, 443)
+    except OSError:  # pragma: no cover - resolver failures surface later anyway
+        pass
+
+
+def _index_offline_dir(offline_dir: Path) -> dict[str, Path]:
+    """Map upper-cased set codes to their offline JSON snapshots."""
+    try:
+        entries = os.scandir(offline_dir)
+    except OSError:
+        return {}
+    with entries:
+        return {
+            Path(entry.name).stem.upper(): Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json")
+        }
+
+
+def load_set_bundle(
+    set_code: str,
+    offline_dir: Path,
+    language: str,
+    *,
+    offline_path: Path | None = None,
+) -> ExportBundle:
     search_error: Exception | None = None
     try:
         return fetch_from_search(set_code, language)
@@ -121,7 +265,7 @@ def load_set_bundle(set_code: str, offline_dir: Path, language: str) -> ExportBu
         )
 
     try:
-        return fetch_from_official(set_code)
+        return fetch_from_official(set_code, offline_dir=offline_dir)
     except Exception as exc:  # pragma: no cover - network branch
         if search_error:
             print(
@@ -132,25 +276,81 @@ def load_set_bundle(set_code: str, offline_dir: Path, language: str) -> ExportBu
             f"Warning: could not download set {set_code}: {exc}. Using offline fallback.",
             file=sys.stderr,
         )
-        return load_offline_bundle(set_code, offline_dir)
+        return load_offline_bundle(set_code, offline_dir, path=offline_path)
 
 
-def fetch_from_official(set_code: str) -> ExportBundle:
+def fetch_from_official(set_code: str, offline_dir: Path | None = None) -> ExportBundle:
     url = OFFICIAL_EXPORT_TEMPLATE.format(set_code=set_code)
-    request = Request(url, headers={"User-Agent": USER_AGENT, "Accept": "application/json"})
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+    # With a cache directory available, revalidate the previous payload via
+    # ETag/Last-Modified: an unchanged set costs one 304 with no body.
+    cache_path = meta_path = None
+    if offline_dir is not None:
+        slug = slugify_series_id(set_code)
+        cache_path = offline_dir / ".cache" / f"{slug}.cache.json"
+        meta_path = offline_dir / ".cache" / f"{slug}.meta.json"
+        if cache_path.exists():
+            meta = _load_official_cache_meta(meta_path)
+            etag = meta.get("etag")
+            last_modified = meta.get("last_modified")
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
     try:
-        with urlopen(request, timeout=30) as response:  # nosec: B310 - trusted host provided by user
-            payload = json.loads(response.read().decode("utf-8"))
+        response = _SESSION.request(url, headers=headers)  # nosec: B310 - trusted host provided by user
+        if response.status == 304 and cache_path is not None:
+            raw = cache_path.read_bytes()
+        else:
+            raw = response.data
+            if cache_path is not None and meta_path is not None:
+                _save_official_cache(cache_path, meta_path, response)
+        # Both decoders accept bytes, so the full-payload str copy is skipped.
+        if orjson is not None:
+            payload = orjson.loads(raw)
+        else:
+            payload = json.loads(raw)
     except HTTPError as error:  # pragma: no cover - network branch
         raise RuntimeError(f"HTTP error {error.code} when fetching {url}") from error
     except URLError as error:  # pragma: no cover - network branch
         raise RuntimeError(f"Failed to reach {url}: {error.reason}") from error
-    except json.JSONDecodeError as error:  # pragma: no cover - depends on remote data
+    except ValueError as error:  # pragma: no cover - depends on remote data
         raise RuntimeError(f"Invalid JSON payload for {set_code}: {error}") from error
 
     return parse_official_payload(payload, set_code)
 
 
+def _load_official_cache_meta(meta_path: Path) -> dict[str, str]:
+    try:
+        meta = json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _save_official_cache(cache_path: Path, meta_path: Path, response: HttpResponse) -> None:
+    """Persist the payload with its validators, best effort.
+
+    Without at least one validator a conditional request is impossible, so
+    nothing is written and the next run downloads the payload again.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    meta: dict[str, str] = {"url": response.url}
+    if etag:
+        meta["etag"] = etag
+    if last_modified:
+        meta["last_modified"] = last_modified
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(response.data)
+        meta_path.write_bytes(json.dumps(meta).encode("utf-8"))
+    except OSError:  # pragma: no cover - cache is an optimisation only
+        pass
+
+
 def fetch_from_search(set_code: str, language: str) -> ExportBundle:
     client = _ensure_search_client()
     try:
@@ -162,15 +362,25 @@ def fetch_from_search(set_code: str, language: str) -> ExportBundle:
     cards_raw = list(result.cards)
     series_row = build_series_row(info, cards_raw, set_code)
     detail_language = _normalise_detail_language(language)
-    fetcher = _ensure_card_page_fetcher()
+    # Detail pages dominate this path's wall time and are independent
+    # requests, so they are all fetched up front on a bounded pool and the
+    # rows are then built synchronously from the prefetched results.
+    detail_map: dict[str, CardPageDetails] = {}
+    if not _CARD_PAGE_FETCHER_DISABLED:
+        fetcher = _ensure_card_page_fetcher()
+        codes = list(dict.fromkeys(code for raw in cards_raw if (code := _raw_card_code(raw))))
+        detail_map = _prefetch_details(fetcher, codes, detail_language)
+    # Set-scoped slug work happens once here instead of once per card.
+    image_prefix = _default_image_prefix(series_row.setCode)
     cards: list[CardRow] = []
     for raw in cards_raw:
+        code = _raw_card_code(raw)
         card = build_card_row(
             raw,
             series_row.id,
             series_row.setCode,
-            detail_fetcher=fetcher,
-            detail_language=detail_language,
+            image_prefix=image_prefix,
+            prefetched_detail=detail_map.get(code) if code else None,
         )
         if card is not None:
             cards.append(card)
@@ -179,34 +389,47 @@ def fetch_from_search(set_code: str, language: str) -> ExportBundle:
     return ExportBundle(series=[series_row], cards=cards)
 
 
+@functools.cache
 def _ensure_search_client() -> CardSearchClient:
-    global _SEARCH_CLIENT
-    if isinstance(_SEARCH_CLIENT, CardSearchClient):
-        return _SEARCH_CLIENT
-    if _SEARCH_CLIENT is _SEARCH_CLIENT_FAILED:
-        raise CardSearchError("Card search crawler initialisation previously failed")
-    try:
-        client = CardSearchClient(user_agent=USER_AGENT)
-    except CardSearchError as error:
-        _SEARCH_CLIENT = _SEARCH_CLIENT_FAILED
-        raise
-    _SEARCH_CLIENT = client
-    return client
+    """Build the process-wide search client once; construction is network-free."""
+    return CardSearchClient(user_agent=USER_AGENT, session=_SESSION)
 
 
+@functools.cache
 def _ensure_card_page_fetcher() -> CardPageFetcher:
-    global _CARD_PAGE_FETCHER
-    if isinstance(_CARD_PAGE_FETCHER, CardPageFetcher):
-        return _CARD_PAGE_FETCHER
-    if _CARD_PAGE_FETCHER is _CARD_PAGE_FETCHER_FAILED:
-        raise CardPageFetchError("Card detail fetcher initialisation previously failed")
-    try:
-        fetcher = CardPageFetcher(user_agent=USER_AGENT)
-    except CardPageFetchError:
-        _CARD_PAGE_FETCHER = _CARD_PAGE_FETCHER_FAILED
-        raise
-    _CARD_PAGE_FETCHER = fetcher
-    return fetcher
+    """Build the process-wide detail fetcher once, on the shared session."""
+    return CardPageFetcher(session=_SESSION)
+
+
+def _raw_card_code(raw: object) -> str | None:
+    if type(raw) is not dict:
+        return None
+    return _first_str(raw, _CARD_FIELD_ALIASES[0])
+
+
+def _prefetch_details(
+    fetcher: CardPageFetcher, card_codes: list[str], language: str
+) -> dict[str, CardPageDetails]:
+    """Fetch every detail page concurrently, tolerating per-card failures."""
+    details: dict[str, CardPageDetails] = {}
+    if not card_codes:
+        return details
+    workers = min(8, len(card_codes))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            code: executor.submit(fetcher.fetch, code, language=language)
+            for code in card_codes
+        }
+        for code, future in futures.items():
+            try:
+                details[code] = future.result()
+            except CardPageFetchError as exc:
+                print(
+                    f"Warning: failed to fetch detail page for {code}: {exc}",
+                    file=sys.stderr,
+                )
+                _disable_card_page_fetcher()
+    return details
 
 
 def _normalise_detail_language(language: str) -> str:
@@ -217,8 +440,8 @@ def _normalise_detail_language(language: str) -> str:
 
 
 def _disable_card_page_fetcher() -> None:
-    global _CARD_PAGE_FETCHER
-    _CARD_PAGE_FETCHER = _CARD_PAGE_FETCHER_FAILED
+    global _CARD_PAGE_FETCHER_DISABLED
+    _CARD_PAGE_FETCHER_DISABLED = True
 
 
 def parse_official_payload(payload: object, set_code: str) -> ExportBundle:
@@ -226,20 +449,24 @@ def parse_official_payload(payload: object, set_code: str) -> ExportBundle:
         cards_raw = payload
         info: dict[str, object] = {}
     elif isinstance(payload, dict):
-        info = _first_dict(payload, ["pack", "info", "product", "meta", "header"])
-        cards_raw = _extract_cards_array(payload)
+        info = _first_dict(payload, _INFO_KEYS)
+        cards_raw = _extract_cards_array(payload, set_code)
     else:
         raise ValueError("Unsupported payload type from official export")
 
     if not isinstance(cards_raw, list):
         raise ValueError("Card list not found in official payload")
 
+    # Filter non-dict entries up front so the hot loop only sees real cards.
+    cards_raw = [raw for raw in cards_raw if type(raw) is dict]
     series_row = build_series_row(info, cards_raw, set_code)
-    cards = [
-        card
-        for raw in cards_raw
-        if (card := build_card_row(raw, series_row.id, series_row.setCode)) is not None
-    ]
+    image_prefix = _default_image_prefix(series_row.setCode)
+    if len(cards_raw) > _PARALLEL_BUILD_THRESHOLD:
+        cards = _build_rows_parallel(
+            cards_raw, series_row.id, series_row.setCode, image_prefix
+        )
+    else:
+        cards = _build_chunk(cards_raw, series_row.id, series_row.setCode, image_prefix)
 
     if not cards:
         raise ValueError(f"No cards could be parsed for set {set_code}")
@@ -247,36 +474,95 @@ def parse_official_payload(payload: object, set_code: str) -> ExportBundle:
     return ExportBundle(series=[series_row], cards=cards)
 
 
-def _extract_cards_array(payload: dict[str, object]) -> object:
-    candidates = [
-        payload.get("data"),
-        payload.get("cards"),
-        payload.get("cardList"),
-        payload.get("list"),
-        payload.get("items"),
-    ]
-    for candidate in candidates:
+_CARDS_ARRAY_KEYS = ("data", "cards", "cardList", "list", "items")
+_CARDS_NESTED_KEYS = ("items", "rows", "list", "data")
+
+# Key path at which each set's payload stored its card array; the upstream
+# schema is stable, so later payloads skip the probing entirely.
+_SCHEMA_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+def _extract_cards_array(payload: dict[str, object], set_code: str | None = None) -> object:
+    path = _SCHEMA_CACHE.get(set_code) if set_code else None
+    if path is not None:
+        value: object = payload
+        for key in path:
+            if not isinstance(value, dict):
+                break
+            value = value.get(key)
+        else:
+            if isinstance(value, list):
+                return value
+        # The cached path missed; the schema changed, so re-probe below.
+    for key in _CARDS_ARRAY_KEYS:
+        candidate = payload.get(key)
         if isinstance(candidate, list):
+            if set_code:
+                _SCHEMA_CACHE[set_code] = (key,)
             return candidate
         if isinstance(candidate, dict):
-            nested = _first_dict(candidate, ["items", "rows", "list", "data"])
-            if isinstance(nested, list):
-                return nested
+            for nested_key in _CARDS_NESTED_KEYS:
+                nested = candidate.get(nested_key)
+                if isinstance(nested, list):
+                    if set_code:
+                        _SCHEMA_CACHE[set_code] = (key, nested_key)
+                    return nested
     return None
 
 
+def _build_chunk(
+    cards_raw: list[object], series_id: str, set_code: str, image_prefix: str
+) -> list[CardRow]:
+    """Build rows for a slice of the payload; module-level so workers can pickle it."""
+    return [
+        card
+        for raw in cards_raw
+        if (card := build_card_row(raw, series_id, set_code, image_prefix=image_prefix))
+        is not None
+    ]
+
+
+def _build_rows_parallel(
+    cards_raw: list[object], series_id: str, set_code: str, image_prefix: str
+) -> list[CardRow]:
+    """Split card construction across a process pool, preserving input order.
+
+    build_card_row is GIL-bound pure-Python work, so threads cannot speed it
+    up; processes scale with cores for the thousand-card sets where the
+    worker startup and pickling overhead is worth paying.
+    """
+    workers = min(os.cpu_count() or 1, 8)
+    if workers <= 1:
+        return _build_chunk(cards_raw, series_id, set_code, image_prefix)
+    chunk_size = -(-len(cards_raw) // workers)
+    chunks = [cards_raw[i : i + chunk_size] for i in range(0, len(cards_raw), chunk_size)]
+    try:
+        # This runs inside load_set_bundle's thread pool, where sibling
+        # threads hold sockets and locks; spawn fresh interpreters instead of
+        # forking the whole threaded process.
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(chunks), mp_context=context
+        ) as executor:
+            futures = [
+                executor.submit(_build_chunk, chunk, series_id, set_code, image_prefix)
+                for chunk in chunks
+            ]
+            return [card for future in futures for card in future.result()]
+    except Exception:  # pragma: no cover - any pool failure degrades to serial
+        return _build_chunk(cards_raw, series_id, set_code, image_prefix)
+
+
 def build_series_row(info: dict[str, object], cards_raw: list[object], set_code: str) -> SeriesRow:
     info = info or {}
-    title = _first_str(info, ["name", "title", "packTitle", "productName", "product_title"]) or set_code
+    title = _first_str(info, _SERIES_TITLE_KEYS) or set_code
     set_code_value = (
-        _first_str(info, ["setCode", "set_code", "productCode", "product_code", "series", "series_id"])
+        _first_str(info, _SERIES_SET_CODE_KEYS)
         or derive_set_code_from_cards(cards_raw, set_code)
     )
     if not isinstance(set_code_value, str):
         set_code_value = str(set_code_value)
-    release_year = _extract_year(
-        _first_str(info, ["release", "releaseDate", "release_date", "date"])
-    )
+    release_year = _extract_year(_first_str(info, _RELEASE_DATE_KEYS))
     if release_year is None:
         release_year = _dt.date.today().year
 
@@ -290,7 +576,7 @@ def build_series_row(info: dict[str, object], cards_raw: list[object], set_code:
 def derive_set_code_from_cards(cards_raw: list[object], default: str) -> str:
     for raw in cards_raw:
         if isinstance(raw, dict):
-            code = _first_str(raw, ["card_no", "cardNo", "cardCode", "card_code", "number"])
+            code = _first_str(raw, _CARD_FIELD_ALIASES[0])
             if code:
                 parts = code.split("-")
                 if len(parts) >= 2:
@@ -306,22 +592,34 @@ def build_card_row(
     *,
     detail_fetcher: CardPageFetcher | None = None,
     detail_language: str = "ja",
+    image_prefix: str | None = None,
+    prefetched_detail: CardPageDetails | None = None,
 ) -> CardRow | None:
     if not isinstance(raw, dict):
         return None
-    card_code = _first_str(raw, ["card_no", "cardNo", "cardCode", "card_code", "number"])
-    title = _first_str(raw, ["card_name", "cardName", "name", "title"])
+    fields: list[str | None] = [None] * len(_CARD_FIELD_ALIASES)
+    ranks = [len(_CARD_FIELD_MAP)] * len(_CARD_FIELD_ALIASES)
+    for key, value in raw.items():
+        slot_rank = _CARD_FIELD_MAP.get(key)
+        if slot_rank is None or not isinstance(value, str):
+            continue
+        slot, rank = slot_rank
+        if rank >= ranks[slot]:
+            continue
+        stripped = value.strip()
+        if stripped:
+            fields[slot] = stripped
+            ranks[slot] = rank
+    card_code, title, rarity_raw, color, level_raw, cost_raw, image_url = fields
     if not card_code or not title:
         return None
 
-    rarity = normalise_rarity(_first_str(raw, ["rarity", "rare", "rar"]))
+    rarity = normalise_rarity(rarity_raw)
     description = build_description(raw)
-    color = _first_str(raw, ["color", "colour", "card_color", "attribute"])
-    level = parse_optional_int(_first_str(raw, ["level", "lv"]))
-    cost = parse_optional_int(_first_str(raw, ["cost", "c"]))
-    image_url = _first_str(raw, ["image", "imageUrl", "image_url", "card_image"])
-    detail = None
-    if detail_fetcher is not None:
+    level = parse_optional_int(level_raw)
+    cost = parse_optional_int(cost_raw)
+    detail = prefetched_detail
+    if detail is None and detail_fetcher is not None:
         try:
             detail = detail_fetcher.fetch(card_code, language=detail_language)
         except CardPageFetchError as exc:
@@ -337,17 +635,20 @@ def build_card_row(
             description = merge_descriptions(detail.effect, description)
         if detail.image_url:
             image_url = detail.image_url
-    image_url = normalise_image_url(image_url, card_code, set_code)
+    image_url = normalise_image_url(image_url, card_code, set_code, image_prefix=image_prefix)
 
     card_id = slugify_card_code(card_code)
+    # rarity/color/seriesId take O(10) distinct values across thousands of
+    # cards; interning collapses them to shared objects, shrinking bundles
+    # and giving dedup comparisons the pointer-equality fast path.
     return CardRow(
         id=card_id,
-        seriesId=series_id,
+        seriesId=sys.intern(series_id),
         cardCode=card_code,
         title=title.strip(),
-        rarity=rarity,
+        rarity=sys.intern(rarity),
         description=description,
-        color=color.upper() if color else None,
+        color=_normalise_color_cached(color) if color else None,
         level=level,
         cost=cost,
         imageUrl=image_url,
@@ -365,53 +666,67 @@ def merge_descriptions(primary: str, secondary: str) -> str:
         return primary
     if secondary in primary:
         return primary
-    parts = [primary]
-    if secondary and secondary not in parts:
-        parts.append(secondary)
-    return "\n\n".join(part for part in parts if part)
-
-
-def normalise_image_url(image_url: str | None, card_code: str, set_code: str) -> str | None:
-    canonical_url = build_default_image_url(card_code, set_code)
-    if not image_url:
-        return canonical_url
-    image_url = image_url.strip()
-    if not image_url:
-        return canonical_url
-    if image_url.startswith("//"):
-        image_url = "https:" + image_url
-    if image_url.startswith("http://") or image_url.startswith("https://"):
-        if "/cardlist/cardimages/" in image_url:
-            return canonical_url
-        return image_url
-    return canonical_url
+    # The early returns already rule out empty or duplicate parts.
+    return f"{primary}\n\n{secondary}"
+
+
+def normalise_image_url(
+    image_url: str | None,
+    card_code: str,
+    set_code: str,
+    *,
+    image_prefix: str | None = None,
+) -> str | None:
+    if image_url:
+        # strip() always allocates; skip it for the common already-clean URL.
+        if image_url[0].isspace() or image_url[-1].isspace():
+            image_url = image_url.strip()
+        if image_url:
+            if image_url.startswith("//"):
+                image_url = "https:" + image_url
+            if image_url.startswith(("http://", "https://")) and (
+                "/cardlist/cardimages/" not in image_url
+            ):
+                return image_url
+    # The canonical URL (and its card-code slug) is only built when the
+    # incoming URL was unusable. Callers that process a whole set pass the
+    # precomputed prefix so the set-code slugging runs once per set.
+    if image_prefix is None:
+        image_prefix = _default_image_prefix(set_code)
+    return image_prefix + _slugify_card_code(card_code) + ".png"
 
 
 def build_default_image_url(card_code: str, set_code: str) -> str:
+    return _default_image_prefix(set_code) + _slugify_card_code(card_code) + ".png"
+
+
+def _default_image_prefix(set_code: str) -> str:
     set_slug = _slugify_set_code(set_code)
-    card_slug = _slugify_card_code(card_code)
     prefix = _first_alpha(set_slug) if set_slug else "card"
     return (
         "https://ws-tcg.com/wordpress/wp-content/images/cardlist/"
-        f"{prefix}/{set_slug}/{card_slug}.png"
+        f"{prefix}/{set_slug}/"
     )
 
 
 def _slugify_set_code(set_code: str) -> str:
-    value = set_code.lower().strip()
-    value = value.replace("/", "_")
-    return _collapse_identifier(value)
+    return _identifier(set_code)
 
 
 def _slugify_card_code(card_code: str) -> str:
-    value = card_code.lower().strip()
-    value = value.replace("/", "_").replace("-", "_")
-    return _collapse_identifier(value)
-
-
-def _collapse_identifier(value: str) -> str:
-    value = re.sub(r"[^0-9a-z_]+", "_", value)
-    value = re.sub(r"_+", "_", value)
+    return _identifier(card_code)
+
+
+def _identifier(value: str) -> str:
+    if _CANONICAL_IDENTIFIER_RE.match(value):
+        return value
+    if value.isascii():
+        # One translate pass covers the lower() copy, the separator
+        # replacements, and the regex walk; only the run collapse remains.
+        return _UNDERSCORE_RUN_RE.sub("_", value.translate(_IDENTIFIER_TABLE)).strip("_")
+    value = value.lower().strip()
+    value = _IDENTIFIER_RE.sub("_", value)
+    value = _UNDERSCORE_RUN_RE.sub("_", value)
     return value.strip("_")
 
 
@@ -423,61 +738,80 @@ def _first_alpha(value: str) -> str:
 
 
 def build_description(raw: dict[str, object]) -> str:
-    parts = []
-    for key in [
-        "ability",
-        "ability1",
-        "ability2",
-        "ability_text",
-        "text",
-        "effect",
-        "flavor",
-        "flavor_text",
-        "ability_en",
-    ]:
-        value = _first_str(raw, [key])
-        if value:
+    # C-level intersection short-circuits cards with no description fields
+    # and narrows the probe to the keys actually present.
+    present = _DESC_KEYS_SET & raw.keys()
+    if not present:
+        return ""
+    parts: list[str] = []
+    seen: set[str] = set()
+    for key in _DESC_KEYS if len(present) > 1 else present:
+        value = raw.get(key)
+        if type(value) is str:
             stripped = value.strip()
-            if stripped and stripped not in parts:
+            if stripped and stripped not in seen:
+                seen.add(stripped)
                 parts.append(stripped)
-    return "\n\n".join(parts) if parts else ""
+    return "\n\n".join(parts)
 
 
 def normalise_rarity(value: str | None) -> str:
     if not value:
         return "C"
-    value = value.strip().upper()
-    return RARITY_NORMALISATION.get(value, "R")
+    return _normalise_rarity_cached(value)
+
+
+# Rarity and color take a handful of distinct spellings across thousands of
+# cards, so the strip/upper work runs once per spelling, not once per card.
+@functools.lru_cache(maxsize=64)
+def _normalise_rarity_cached(value: str) -> str:
+    return RARITY_NORMALISATION.get(value.strip().upper(), "R")
+
+
+@functools.lru_cache(maxsize=64)
+def _normalise_color_cached(value: str) -> str:
+    return sys.intern(value.upper())
 
 
 def merge_bundles(bundles: Iterable[ExportBundle]) -> ExportBundle:
-    series: list[SeriesRow] = []
-    cards: list[CardRow] = []
-    seen_series: set[str] = set()
-    seen_cards: set[tuple[str, str]] = set()
+    # Insertion-ordered dicts dedupe and keep first-seen order in one
+    # setdefault per item, and attrgetter builds the sort key in C.
+    series_by_id: dict[str, SeriesRow] = {}
+    cards_by_key: dict[tuple[str, str], CardRow] = {}
 
     for bundle in bundles:
         for item in bundle.series:
-            if item.id not in seen_series:
-                series.append(item)
-                seen_series.add(item.id)
+            series_by_id.setdefault(item.id, item)
         for card in bundle.cards:
-            key = (card.id, card.cardCode)
-            if key not in seen_cards:
-                cards.append(card)
-                seen_cards.add(key)
+            cards_by_key.setdefault((card.id, card.cardCode), card)
 
-    cards.sort(key=lambda c: (c.seriesId, c.cardCode))
-    return ExportBundle(series=series, cards=cards)
+    cards = sorted(cards_by_key.values(), key=attrgetter("seriesId", "cardCode"))
+    return ExportBundle(series=list(series_by_id.values()), cards=cards)
 
 
-def load_offline_bundle(set_code: str, offline_dir: Path) -> ExportBundle:
-    path = offline_dir / f"{set_code.lower()}.json"
+def load_offline_bundle(
+    set_code: str, offline_dir: Path, *, path: Path | None = None
+) -> ExportBundle:
+    if path is None:
+        path = offline_dir / f"{set_code.lower()}.json"
     if not path.exists():
         raise FileNotFoundError(
             f"Offline data for set {set_code!r} not found at {path}"  # pragma: no cover - configuration issue
         )
-    data = json.loads(path.read_text(encoding="utf-8"))
+    # The snapshots change rarely, so the parsed bundle is memoized as a
+    # pickle invalidated by the JSON's mtime; reruns skip parsing entirely.
+    cache_path = path.parent / ".cache" / f"{path.stem}.pkl"
+    try:
+        if cache_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            cached = pickle.loads(cache_path.read_bytes())
+            if isinstance(cached, ExportBundle):
+                return cached
+    except (OSError, pickle.UnpicklingError):
+        pass
+    except Exception:  # pragma: no cover - stale pickle from an old schema
+        pass
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     series_data = data.get("series")
     cards_data = data.get("cards", [])
     if not series_data:
@@ -503,17 +837,32 @@ def load_offline_bundle(set_code: str, offline_dir: Path) -> ExportBundle:
         )
         for item in cards_data
     ]
-    return ExportBundle(series=[series], cards=cards)
+    bundle = ExportBundle(series=[series], cards=cards)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        # Caching is best effort; the bundle itself parsed fine.
+        pass
+    return bundle
 
 
 def slugify_card_code(card_code: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", card_code.lower())
-    return normalized.strip("-")
+    return _slug(card_code)
 
 
 def slugify_series_id(set_code: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", set_code.lower())
-    return normalized.strip("-")
+    return _slug(set_code)
+
+
+def _slug(value: str) -> str:
+    if _CANONICAL_SLUG_RE.match(value):
+        return value
+    if value.isascii():
+        # One translate pass replaces the lower() copy plus the regex walk;
+        # only the dash-run collapse still needs the engine.
+        return _DASH_RUN_RE.sub("-", value.translate(_SLUG_TABLE)).strip("-")
+    return _SLUG_RE.sub("-", value.lower()).strip("-")
 
 
 def parse_optional_int(value: str | None) -> int | None:
@@ -531,7 +880,9 @@ def parse_optional_int(value: str | None) -> int | None:
 def _first_str(source: dict[str, object], keys: Iterable[str]) -> str | None:
     for key in keys:
         value = source.get(key)
-        if isinstance(value, str):
+        # Single pointer comparison instead of isinstance's MRO walk; JSON
+        # payloads never contain str subclasses.
+        if value.__class__ is str:
             stripped = value.strip()
             if stripped:
                 return stripped
@@ -541,7 +892,7 @@ def _first_str(source: dict[str, object], keys: Iterable[str]) -> str | None:
 def _first_dict(source: dict[str, object], keys: Iterable[str]) -> dict[str, object]:
     for key in keys:
         value = source.get(key)
-        if isinstance(value, dict):
+        if value.__class__ is dict:
             return value
     return {}
 
@@ -549,7 +900,7 @@ def _first_dict(source: dict[str, object], keys: Iterable[str]) -> dict[str, obj
 def _extract_year(value: str | None) -> int | None:
     if not value:
         return None
-    match = re.search(r"(20\d{2}|19\d{2})", value)
+    match = _YEAR_RE.search(value)
     if match:
         return int(match.group(1))
     return None
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Minimal keep-alive HTTP helper shared by the importer's network clients."""
+from __future__ import annotations
+
+import gzip
+import http.client
+import threading
+import zlib
+from dataclasses import dataclass
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_TIMEOUT = 30.0
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+@dataclass
+class HttpResponse:
+    """Response data captured after the connection has been drained."""
+
+    url: str
+    status: int
+    headers: http.client.HTTPMessage
+    data: bytes
+
+
+class HttpSession:
+    """HTTP(S) client that reuses one connection per host and thread.
+
+    ``urllib.request`` opens a fresh TCP + TLS connection for every call,
+    paying a handshake each time. ``http.client`` keeps the socket alive, so
+    repeated requests to the same host (the common case here: ws-tcg.com)
+    skip the handshake entirely. Connections are kept in thread-local storage
+    so one session can be shared safely with ThreadPoolExecutor workers.
+    """
+
+    def __init__(self, *, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        max_redirects: int = 5,
+    ) -> HttpResponse:
+        """Issue a request, following redirects, and return the full response.
+
+        Raises :class:`urllib.error.HTTPError` for 4xx/5xx statuses and
+        :class:`urllib.error.URLError` for connection problems, matching the
+        exceptions callers already handle for ``urlopen``.
+        """
+        headers = dict(headers or {})
+        # HTML and JSON payloads from the card list compress 3-10x; always
+        # advertise compression and decode transparently below.
+        headers.setdefault("Accept-Encoding", "gzip, deflate")
+        for _ in range(max_redirects + 1):
+            status, response_headers, data = self._request_once(url, method, headers, body)
+            if status in _REDIRECT_STATUSES:
+                location = response_headers.get("Location")
+                if not location:
+                    break
+                url = urljoin(url, location)
+                if status == 303 or (status in {301, 302} and method == "POST"):
+                    method = "GET"
+                    body = None
+                continue
+            if status >= 400:
+                raise HTTPError(url, status, f"HTTP {status}", response_headers, None)
+            return HttpResponse(url=url, status=status, headers=response_headers, data=data)
+        raise URLError(f"Too many redirects for {url}")
+
+    def close(self) -> None:
+        connections = getattr(self._local, "connections", None)
+        if connections:
+            for connection in connections.values():
+                connection.close()
+            connections.clear()
+
+    def _request_once(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        # A kept-alive socket may have been closed by the server between
+        # requests; retry once on a fresh connection before giving up.
+        for attempt in (0, 1):
+            connection = self._connection(url)
+            try:
+                connection.request(method, _request_target(url), body=body, headers=headers)
+                response = connection.getresponse()
+                data = _decode_body(response.read(), response.headers.get("Content-Encoding"))
+                return response.status, response.headers, data
+            except (http.client.HTTPException, OSError) as error:
+                self._drop_connection(url)
+                if attempt:
+                    raise URLError(error) from error
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _connection(self, url: str) -> http.client.HTTPConnection:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+        connection = connections.get(key)
+        if connection is None:
+            if parts.scheme == "https":
+                connection = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+            else:
+                connection = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+            connections[key] = connection
+        return connection
+
+    def _drop_connection(self, url: str) -> None:
+        parts = urlsplit(url)
+        connections = getattr(self._local, "connections", {})
+        connection = connections.pop((parts.scheme, parts.netloc), None)
+        if connection is not None:
+            connection.close()
+
+
+def _decode_body(data: bytes, content_encoding: str | None) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # Some servers send raw deflate streams without the zlib header.
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def _request_target(url: str) -> str:
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    return target
+
+
+__all__ = [
+    "HttpResponse",
+    "HttpSession",
+]
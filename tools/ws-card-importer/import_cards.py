@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import json
+import shutil
 import sys
 import typing as t
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from pathlib import Path
-from urllib.request import urlopen
 from urllib.error import URLError
 import io
 
+from http_session import HttpSession
+
+try:  # Optional accelerator; the stdlib fallback keeps the tools dependency-free.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
+
 # Paths used to keep platform assets in sync.
 REPO_ROOT = Path(__file__).resolve().parents[2]
 COMMON_RESOURCES_PATH = REPO_ROOT / "composeApp" / "src" / "commonMain" / "resources" / "cards.json"
@@ -20,7 +28,7 @@ ANDROID_ASSETS_PATH = REPO_ROOT / "composeApp" / "src" / "androidMain" / "assets
 
 
 # Expected CSV headers.
-REQUIRED_COLUMNS = {
+REQUIRED_COLUMNS = frozenset({
     "series_id",
     "series_name",
     "set_code",
@@ -34,10 +42,10 @@ REQUIRED_COLUMNS = {
     "level",
     "cost",
     "image_url",
-}
+})
 
 
-@dataclass
+@dataclass(slots=True)
 class SeriesRow:
     id: str
     name: str
@@ -45,7 +53,7 @@ class SeriesRow:
     releaseYear: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CardRow:
     id: str
     seriesId: str
@@ -59,29 +67,97 @@ class CardRow:
     imageUrl: t.Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportBundle:
     series: t.List[SeriesRow]
     cards: t.List[CardRow]
 
-    def to_json(self, pretty: bool = False) -> str:
+    def to_json_bytes(self, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 bytes, the form every write path needs."""
+        if orjson is not None:
+            # orjson serializes dataclasses natively, skipping the per-row
+            # dict materialization entirely.
+            data: object = {"series": self.series, "cards": self.cards}
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, option=option)
+        # Shallow per-field copies; dataclasses.asdict would deep-copy every
+        # value, which is pure allocation churn for these flat rows.
         data = {
-            "series": [asdict(s) for s in self.series],
-            "cards": [asdict(c) for c in self.cards],
+            "series": [_row_dict(s) for s in self.series],
+            "cards": [_row_dict(c) for c in self.cards],
         }
         if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
-def mirror_android_assets_if_applicable(output_path: Path, content: str) -> None:
+    def to_json(self, pretty: bool = False) -> str:
+        return self.to_json_bytes(pretty=pretty).decode("utf-8")
+
+    def write_json_stream(self, path: Path, pretty: bool = False) -> None:
+        """Write the bundle to ``path`` row by row.
+
+        Serializing one series/card at a time keeps peak memory proportional
+        to a single row instead of the whole document, which matters once the
+        aggregated dataset reaches tens of thousands of cards. The emitted
+        bytes are identical to ``to_json``.
+        """
+
+        with path.open("wb") as handle:
+            if pretty:
+                handle.write(b"{\n")
+                _write_pretty_array(handle, b'  "series": ', self.series)
+                handle.write(b",\n")
+                _write_pretty_array(handle, b'  "cards": ', self.cards)
+                handle.write(b"\n}")
+            else:
+                handle.write(b'{"series":[')
+                _write_compact_rows(handle, self.series)
+                handle.write(b'],"cards":[')
+                _write_compact_rows(handle, self.cards)
+                handle.write(b"]}")
+
+
+def _row_dict(row: object) -> dict[str, object]:
+    return {field.name: getattr(row, field.name) for field in fields(row)}  # type: ignore[arg-type]
+
+
+def _dump_row(row: object, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_INDENT_2 if pretty else 0)
+    data = _row_dict(row)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_compact_rows(handle: t.IO[bytes], rows: t.Sequence[object]) -> None:
+    for index, row in enumerate(rows):
+        if index:
+            handle.write(b",")
+        handle.write(_dump_row(row, pretty=False))
+
+
+def _write_pretty_array(handle: t.IO[bytes], label: bytes, rows: t.Sequence[object]) -> None:
+    handle.write(label)
+    if not rows:
+        handle.write(b"[]")
+        return
+    handle.write(b"[\n")
+    for index, row in enumerate(rows):
+        if index:
+            handle.write(b",\n")
+        handle.write(b"    " + _dump_row(row, pretty=True).replace(b"\n", b"\n    "))
+    handle.write(b"\n  ]")
+
+
+def mirror_android_assets_if_applicable(output_path: Path) -> None:
     """Mirror the generated JSON into the Android assets directory when using the default path."""
 
     try:
         if output_path.resolve() != COMMON_RESOURCES_PATH:
             return
         ANDROID_ASSETS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        ANDROID_ASSETS_PATH.write_text(content, encoding="utf-8")
+        shutil.copyfile(output_path, ANDROID_ASSETS_PATH)
         print(f"Mirrored card data to {ANDROID_ASSETS_PATH}")
     except Exception as exc:  # pragma: no cover - filesystem edge cases
         print(
@@ -91,52 +167,77 @@ def mirror_android_assets_if_applicable(output_path: Path, content: str) -> None
 
 
 class CsvCardImporter:
-    def __init__(self, rows: t.Iterable[t.Mapping[str, str]]):
-        self._rows = list(rows)
-        if not self._rows:
-            raise ValueError("CSV file does not contain any data rows")
+    def __init__(self, columns: t.Mapping[str, int], rows: t.Iterable[t.Sequence[str]]):
+        # Rows are positional lists straight from csv.reader, consumed
+        # lazily in run(); buffering or converting them to dicts here would
+        # redo per-row key hashing the positional layout avoids.
+        self._columns = columns
+        self._rows = iter(rows)
 
     def run(self) -> ExportBundle:
+        first = next(self._rows, None)
+        if first is None:
+            raise ValueError("CSV file does not contain any data rows")
+
+        # Resolve every column index once; the loop then reads plain list
+        # offsets instead of hashing thirteen keys per row.
+        columns = self._columns
+        i_series_id = columns["series_id"]
+        i_series_name = columns["series_name"]
+        i_set_code = columns["set_code"]
+        i_release_year = columns["release_year"]
+        i_card_id = columns["card_id"]
+        i_card_code = columns["card_code"]
+        i_title = columns["title"]
+        i_rarity = columns["rarity"]
+        i_description = columns["description"]
+        i_color = columns["color"]
+        i_level = columns["level"]
+        i_cost = columns["cost"]
+        i_image_url = columns["image_url"]
+
         series_map: dict[str, SeriesRow] = {}
         cards: list[CardRow] = []
 
-        for row in self._rows:
-            release_year = _to_int(row.get("release_year"), "release_year")
-            level = _to_optional_int(row.get("level"))
-            cost = _to_optional_int(row.get("cost"))
+        for row in itertools.chain((first,), self._rows):
+            release_year = _to_int(row[i_release_year], "release_year")
+            level = _to_optional_int(row[i_level])
+            cost = _to_optional_int(row[i_cost])
 
-            series_id = row["series_id"].strip()
+            series_id = row[i_series_id].strip()
             if series_id not in series_map:
                 series_map[series_id] = SeriesRow(
                     id=series_id,
-                    name=row["series_name"].strip(),
-                    setCode=row["set_code"].strip(),
+                    name=row[i_series_name].strip(),
+                    setCode=row[i_set_code].strip(),
                     releaseYear=release_year,
                 )
 
             cards.append(
                 CardRow(
-                    id=row["card_id"].strip(),
+                    id=row[i_card_id].strip(),
                     seriesId=series_id,
-                    cardCode=row["card_code"].strip(),
-                    title=row["title"].strip(),
-                    rarity=row["rarity"].strip(),
-                    description=row["description"].strip(),
-                    color=_to_optional_str(row.get("color")),
+                    cardCode=row[i_card_code].strip(),
+                    title=row[i_title].strip(),
+                    rarity=row[i_rarity].strip(),
+                    description=row[i_description].strip(),
+                    color=row[i_color].strip() or None,
                     level=level,
                     cost=cost,
-                    imageUrl=_to_optional_str(row.get("image_url")),
+                    imageUrl=row[i_image_url].strip() or None,
                 )
             )
 
         return ExportBundle(series=list(series_map.values()), cards=cards)
 
 
-def _load_csv(path: str) -> list[dict[str, str]]:
-    if path.startswith("http://") or path.startswith("https://"):
+def _load_csv(path: str) -> tuple[dict[str, int], t.Iterator[list[str]]]:
+    if path.startswith(("http://", "https://")):
         try:
-            with urlopen(path) as response:  # nosec: B310 - trusted source controlled by user
-                content_bytes = response.read()
+            # HttpSession follows redirects and negotiates gzip; a remote CSV
+            # downloads in one compressed round-trip.
+            response = HttpSession().request(path)  # nosec: B310 - trusted source controlled by user
+            content_bytes = response.data
         except URLError as exc:  # pragma: no cover - network error branch
             raise RuntimeError(f"Unable to download CSV from {path}: {exc}") from exc
         content = content_bytes.decode("utf-8-sig")
@@ -147,12 +248,30 @@ def _load_csv(path: str) -> list[dict[str, str]]:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         stream = csv_path.open("r", encoding="utf-8-sig", newline="")
 
+    # Plain csv.reader yields positional lists; resolving the header to
+    # indices once here spares DictReader's per-row dict construction.
+    reader = csv.reader(stream)
+    header = next(reader, None) or []
+    columns = {name.strip(): index for index, name in enumerate(header)}
+    if not REQUIRED_COLUMNS.issubset(columns):
+        missing = REQUIRED_COLUMNS.difference(columns)
+        stream.close()
+        raise ValueError(f"CSV file is missing required columns: {', '.join(sorted(missing))}")
+    return columns, _iter_csv_rows(stream, reader, len(header))
+
+
+def _iter_csv_rows(
+    stream: t.IO[str], reader: t.Iterator[list[str]], width: int
+) -> t.Iterator[list[str]]:
+    # Yielding straight from the reader keeps parsing, validation, and row
+    # construction in one pass; the stream closes once the rows run out.
+    # Short rows are padded so positional access matches DictReader's
+    # tolerance for missing trailing fields.
     with stream:
-        reader = csv.DictReader(stream)
-        missing = REQUIRED_COLUMNS - set(reader.fieldnames or [])
-        if missing:
-            raise ValueError(f"CSV file is missing required columns: {', '.join(sorted(missing))}")
-        return [t.cast(dict[str, str], row) for row in reader]
+        for row in reader:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
 
 
 def _to_int(value: t.Optional[str], field_name: str) -> int:
@@ -176,13 +295,6 @@ def _to_optional_int(value: t.Optional[str]) -> t.Optional[int]:
         raise ValueError(f"Expected an integer, got {value!r}") from exc
 
 
-def _to_optional_str(value: t.Optional[str]) -> t.Optional[str]:
-    if value is None:
-        return None
-    text = value.strip()
-    return text or None
-
-
 def parse_args(argv: t.Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Convert Weiss Schwarz cards CSV to cards.json")
     parser.add_argument("csv", help="Path or URL to the source CSV file")
@@ -202,14 +314,14 @@ def parse_args(argv: t.Sequence[str]) -> argparse.Namespace:
 
 def main(argv: t.Sequence[str]) -> int:
     args = parse_args(argv)
-    rows = _load_csv(args.csv)
-    bundle = CsvCardImporter(rows).run()
-    output_text = bundle.to_json(pretty=args.pretty)
+    columns, rows = _load_csv(args.csv)
+    bundle = CsvCardImporter(columns, rows).run()
+    output_bytes = bundle.to_json_bytes(pretty=args.pretty)
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(output_text, encoding="utf-8")
-    mirror_android_assets_if_applicable(output_path, output_text)
+    output_path.write_bytes(output_bytes)
+    mirror_android_assets_if_applicable(output_path)
     print(f"Wrote {len(bundle.series)} series and {len(bundle.cards)} cards to {output_path}")
     return 0
 